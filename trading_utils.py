@@ -8,10 +8,13 @@ and placing trades. These are MANUAL functions that must be explicitly called.
     Use only with funds you can afford to lose. Requires wallet with USDC balance.
 
 Main Functions:
-    - get_clob_client(): Create authenticated Polymarket API client
+    - get_clob_client(): Get the shared authenticated Polymarket API client
+    - invalidate_clob_client(): Drop the cached client (e.g. after an auth error)
     - approveContracts(): One-time setup to approve USDC and CTF tokens (required before trading)
     - market_action(marketId, action, price, size): Place buy/sell orders
     - get_position(marketId): Check current position value in a market
+    - get_positions(marketIds): Check position values in several markets concurrently
+    - invalidate_position_cache(marketId): Drop cached position data for a market
 
 Usage Example:
     from trading_utils import approveContracts, market_action
@@ -29,19 +32,27 @@ Usage Example:
 
 Required:
     - PK environment variable (private key)
+    - POLYGON_RPC_URL environment variable (optional, defaults to https://polygon-rpc.com)
     - USDC balance in wallet
-    - erc20ABI.json file
 """
 
 from py_clob_client.constants import POLYGON
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, BalanceAllowanceParams, AssetType
+from py_clob_client.exceptions import PolyApiException
 from py_clob_client.order_builder.constants import BUY
 
+from eth_account import Account
+from eth_utils import keccak
 from web3 import Web3
+from web3.exceptions import TimeExhausted
 from web3.middleware import geth_poa_middleware
 
-import json
+import concurrent.futures
+import functools
+import itertools
+import requests
+from requests.adapters import HTTPAdapter
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -49,21 +60,56 @@ load_dotenv()
 import time
 
 import os
+import threading
 
-MAX_INT = 2**256 - 1
+_PK = os.getenv("PK")
 
-def get_clob_client():
-    """
-    Create and authenticate a Polymarket CLOB client for trading.
-    
-    Returns:
-        ClobClient: Authenticated Polymarket API client, or None if authentication fails
-        
-    Environment Variables:
-        PK: Polygon wallet private key (hex string)
-    """
+MAX_UINT256 = (1 << 256) - 1
+
+# Polygon validators ignore transactions tipping less than ~25-30 gwei
+PRIORITY_FEE_GWEI = 30
+
+# post_order retry policy for transient CLOB errors (delays in seconds)
+POST_ORDER_ATTEMPTS = 3
+POST_ORDER_MIN_DELAY = 0.1
+POST_ORDER_MAX_DELAY = 2
+
+# Public endpoint by default; point this at a dedicated provider
+# (Alchemy, QuickNode, ...) for much lower latency and higher rate limits
+RPC_URL = os.getenv("POLYGON_RPC_URL", "https://polygon-rpc.com")
+
+USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"   # usdc.e
+CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
+
+# Approval calldata is encoded by hand; only the operator address varies
+APPROVE_SELECTOR = keccak(text="approve(address,uint256)")[:4]
+SET_APPROVAL_FOR_ALL_SELECTOR = keccak(text="setApprovalForAll(address,bool)")[:4]
+ALLOWANCE_SELECTOR = keccak(text="allowance(address,address)")[:4]
+IS_APPROVED_FOR_ALL_SELECTOR = keccak(text="isApprovedForAll(address,address)")[:4]
+# Both approvals use ~50k gas; unused gas is refunded, so the limit can be generous
+APPROVAL_GAS_LIMIT = 100_000
+
+# Authenticated client shared by all trading calls; deriving API creds costs
+# several HTTPS round-trips, so it is done once per process.
+_CLOB_CLIENT = None
+_CLOB_LOCK = threading.Lock()
+
+# get_position caches (TTLs in seconds). Balances change whenever a resting
+# order fills, so they expire too, just more slowly than the best bid.
+# Every invalidation bumps the generation; a fetch that started before an
+# invalidation does not write its (possibly stale) result back.
+BALANCE_TTL = 5
+ORDER_BOOK_TTL = 0.5
+POSITION_CACHE_MAXSIZE = 256   # per cache; the oldest entry is dropped beyond this
+_BALANCE_CACHE = {}       # marketId -> (fetched_at, shares)
+_BEST_BID_CACHE = {}      # marketId -> (fetched_at, best bid price)
+_POSITION_CACHE_GENERATION = 0
+_POSITION_CACHE_LOCK = threading.Lock()
+
+
+def _create_clob_client():
     host = "https://clob.polymarket.com"
-    key = os.getenv("PK")
+    key = _PK
     chain_id = POLYGON
     
     if key is None:
@@ -81,6 +127,174 @@ def get_clob_client():
         return None
 
 
+def get_clob_client():
+    """
+    Get the shared authenticated Polymarket CLOB client for trading.
+    
+    The client is created and authenticated on first use and reused by
+    subsequent calls. Failed attempts are not cached.
+    
+    Returns:
+        ClobClient: Authenticated Polymarket API client, or None if authentication fails
+        
+    Environment Variables:
+        PK: Polygon wallet private key (hex string)
+    """
+    global _CLOB_CLIENT
+    if _CLOB_CLIENT is None:
+        with _CLOB_LOCK:
+            if _CLOB_CLIENT is None:
+                _CLOB_CLIENT = _create_clob_client()
+    return _CLOB_CLIENT
+
+
+def invalidate_clob_client():
+    """
+    Drop the cached CLOB client so the next get_clob_client() call re-authenticates.
+    
+    Call this after an authentication error (e.g. expired or revoked API creds).
+    """
+    global _CLOB_CLIENT
+    with _CLOB_LOCK:
+        _CLOB_CLIENT = None
+
+
+def _rpc_batch_responses(endpoint, calls):
+    """
+    Send several JSON-RPC calls to a node in a single HTTP POST.
+    
+    Args:
+        endpoint (str): JSON-RPC endpoint URL
+        calls (list): (method, params) tuples
+        
+    Returns:
+        list: The raw JSON-RPC response object of each call, in the same order
+        as `calls`. Each has either a 'result' or an 'error' key.
+        
+    Raises:
+        ValueError: If the node rejects the batch as a whole
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    res = _get_session().post(endpoint, json=payload, timeout=30)
+    res.raise_for_status()
+
+    body = res.json()
+    # Rejected or rate-limited batches often come back as a single error object
+    if not isinstance(body, list):
+        raise ValueError(f"RPC batch rejected: {body}")
+
+    responses = {item.get("id"): item for item in body}
+    return [
+        responses.get(i, {"error": "no response for this call"})
+        for i in range(len(calls))
+    ]
+
+
+def _rpc_batch(endpoint, calls):
+    """
+    Send several JSON-RPC calls in a single HTTP POST and return their results.
+    
+    Returns:
+        list: The result of each call, in the same order as `calls`
+        
+    Raises:
+        ValueError: If the batch is rejected or any call in it returns an RPC error
+    """
+    results = []
+    for (method, _), item in zip(calls, _rpc_batch_responses(endpoint, calls)):
+        if "error" in item:
+            raise ValueError(f"RPC call {method} failed: {item['error']}")
+        results.append(item.get("result"))
+    return results
+
+
+def _wait_for_receipts(endpoint, tx_hashes, timeout, poll_latency=1.0):
+    """
+    Wait until every transaction in `tx_hashes` is mined.
+    
+    Each poll asks for all still-pending receipts in a single batched request.
+    Polygon produces a block roughly every 2 seconds, so polling faster than
+    `poll_latency` (default 1s) would mostly return the same empty results.
+    
+    Returns:
+        list: Raw receipt dicts, in the same order as `tx_hashes`
+        
+    Raises:
+        TimeExhausted: If some transactions are still pending after `timeout` seconds
+    """
+    receipts = {}
+    deadline = time.time() + timeout
+
+    while True:
+        pending = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+        results = _rpc_batch(endpoint, [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in pending])
+        for tx_hash, receipt in zip(pending, results):
+            if receipt is not None:
+                receipts[tx_hash] = receipt
+
+        if len(receipts) == len(tx_hashes):
+            return [receipts[tx_hash] for tx_hash in tx_hashes]
+        if time.time() > deadline:
+            raise TimeExhausted(f"{len(tx_hashes) - len(receipts)} transactions not mined after {timeout} seconds")
+        time.sleep(poll_latency)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Return the keep-alive HTTP session shared by all Polygon RPC traffic."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _get_account():
+    """Return the wallet's LocalAccount, deriving the signing key from PK once."""
+    return Account.from_key(_PK)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_web3():
+    """Return the shared Polygon Web3 instance, created on first use."""
+    web3 = Web3(Web3.HTTPProvider(
+        RPC_URL,
+        request_kwargs={"timeout": 30},
+        session=_get_session(),
+    ))
+    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+    return web3
+
+
+def _encode_address(address):
+    """ABI-encode an address as a left-padded 32-byte word."""
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+def _hex_to_int(value):
+    """Decode a hex quantity from a JSON-RPC result; empty results ("0x") count as 0."""
+    return int(value, 16) if value and value != "0x" else 0
+
+
+def _owner_operator_calldata(selector, owner, operator):
+    """Calldata for a view call taking (owner, operator), e.g. allowance() or isApprovedForAll()."""
+    return selector + _encode_address(owner) + _encode_address(operator)
+
+
+def _approve_calldata(operator):
+    """Calldata for ERC20 approve(operator, MAX_UINT256)."""
+    return APPROVE_SELECTOR + _encode_address(operator) + MAX_UINT256.to_bytes(32, 'big')
+
+
+def _set_approval_for_all_calldata(operator):
+    """Calldata for ERC1155 setApprovalForAll(operator, True)."""
+    return SET_APPROVAL_FOR_ALL_SELECTOR + _encode_address(operator) + (1).to_bytes(32, 'big')
+
+
 def approveContracts():
     """
     Approve USDC and CTF token contracts for trading on Polymarket.
@@ -97,79 +311,129 @@ def approveContracts():
         - 0xC5d563A36AE78145C45a50134d48A1215220f80a (Neg Risk Adapter)
         - 0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296 (CTF Exchange)
     
-    Runtime: ~30-60 seconds (6 transactions total)
+    Existing approvals are checked first and skipped, so re-running on an
+    already approved wallet sends no transactions. Nothing is sent while the
+    wallet still has unmined transactions, since they may be approvals from
+    an earlier run. Missing approvals are
+    encoded and signed locally with fixed gas limits and locally allocated
+    nonces, submitted in a single JSON-RPC batch and then confirmed together.
+    
+    Runtime: roughly one block inclusion time (up to 6 transactions), or
+    a single read request if everything is already approved
     
     Returns:
         None (prints transaction hashes for verification)
         
     Raises:
-        Web3 exceptions if transactions fail
+        ValueError: If the node rejects a request or transaction, or an approval reverts on-chain
+        requests.HTTPError: If the RPC endpoint returns an HTTP error
+        TimeExhausted: If the approvals are not mined within 600 seconds
     """
-    web3 = Web3(Web3.HTTPProvider("https://polygon-rpc.com"))
-    web3.middleware_onion.inject(geth_poa_middleware, layer=0)
-    wallet = web3.eth.account.privateKeyToAccount(os.getenv("PK"))
-    
-    
-    with open('erc20ABI.json', 'r') as file:
-        erc20_abi = json.load(file)
+    if _PK is None:
+        print("Environment variable 'PK' cannot be found")
+        return
 
-    ctf_address = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-    erc1155_set_approval = """[{"inputs": [{ "internalType": "address", "name": "operator", "type": "address" },{ "internalType": "bool", "name": "approved", "type": "bool" }],"name": "setApprovalForAll","outputs": [],"stateMutability": "nonpayable","type": "function"}]"""
+    web3 = _get_web3()
+    wallet = _get_account()
+    endpoint = web3.provider.endpoint_uri
+    operators = ['0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E', '0xC5d563A36AE78145C45a50134d48A1215220f80a', '0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296']
 
-    usdc_contract = web3.eth.contract(address="0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174", abi=erc20_abi)   # usdc.e
-    ctf_contract = web3.eth.contract(address=ctf_address, abi=erc1155_set_approval)
-    
+    # Read every current allowance in one batch and only re-approve what is missing
+    checks = _rpc_batch(endpoint, [
+        call
+        for address in operators
+        for call in (
+            ("eth_call", [{"to": USDC_ADDRESS, "data": Web3.to_hex(_owner_operator_calldata(ALLOWANCE_SELECTOR, wallet.address, address))}, "latest"]),
+            ("eth_call", [{"to": CTF_ADDRESS, "data": Web3.to_hex(_owner_operator_calldata(IS_APPROVED_FOR_ALL_SELECTOR, wallet.address, address))}, "latest"]),
+        )
+    ])
 
-    for address in ['0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E', '0xC5d563A36AE78145C45a50134d48A1215220f80a', '0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296']:
-        usdc_nonce = web3.eth.getTransactionCount( wallet.address )
-        raw_usdc_txn = usdc_contract.functions.approve(address, int(MAX_INT, 0)).build_transaction({
-            "chainId": 137, 
-            "from": wallet.address, 
-            "nonce": usdc_nonce
-        })
-        signed_usdc_txn = web3.eth.account.sign_transaction(raw_usdc_txn, private_key=os.getenv("PK"))
-        usdc_tx_receipt = web3.eth.wait_for_transaction_receipt(signed_usdc_txn, 600)
+    approvals = []
 
-        tx_hash = usdc_tx_receipt.get('transactionHash', b'').hex() if hasattr(usdc_tx_receipt.get('transactionHash', b''), 'hex') else 'N/A'
-        print(f'USDC Transaction for {address} completed. Hash: {tx_hash}')
-        time.sleep(1)
+    for i, address in enumerate(operators):
+        usdc_allowance, ctf_approved = _hex_to_int(checks[2 * i]), _hex_to_int(checks[2 * i + 1])
 
-        ctf_nonce = web3.eth.getTransactionCount( wallet.address )
-        
-        raw_ctf_approval_txn = ctf_contract.functions.setApprovalForAll(address, True).buildTransaction({
-            "chainId": 137, 
-            "from": wallet.address, 
-            "nonce": ctf_nonce
-        })
+        if usdc_allowance >= MAX_UINT256 >> 1:
+            print(f'USDC already approved for {address}')
+        else:
+            approvals.append((f'USDC Transaction for {address}', USDC_ADDRESS, _approve_calldata(address)))
 
-        signed_ctf_approval_tx = web3.eth.account.sign_transaction(raw_ctf_approval_txn, private_key=os.getenv("PK"))
-        send_ctf_approval_tx = web3.eth.send_raw_transaction(signed_ctf_approval_tx.rawTransaction)
-        ctf_approval_tx_receipt = web3.eth.wait_for_transaction_receipt(send_ctf_approval_tx, 600)
+        if ctf_approved:
+            print(f'CTF already approved for {address}')
+        else:
+            approvals.append((f'CTF Transaction for {address}', CTF_ADDRESS, _set_approval_for_all_calldata(address)))
 
-        tx_hash = ctf_approval_tx_receipt.get('transactionHash', b'').hex() if hasattr(ctf_approval_tx_receipt.get('transactionHash', b''), 'hex') else 'N/A'
-        print(f'CTF Transaction for {address} completed. Hash: {tx_hash}')
-        time.sleep(1)
+    if not approvals:
+        return
 
+    # Nonce counts and the pending block's base fee come back in one batch.
+    # The allowance reads above only see mined state. If this wallet still has
+    # transactions in the mempool (e.g. approvals from an earlier run), sending
+    # now could duplicate them, so wait for those to be mined instead.
+    latest_count, pending_count, pending_block = _rpc_batch(endpoint, [
+        ("eth_getTransactionCount", [wallet.address, "latest"]),
+        ("eth_getTransactionCount", [wallet.address, "pending"]),
+        ("eth_getBlockByNumber", ["pending", False]),
+    ])
+    latest_nonce, pending_nonce = _hex_to_int(latest_count), _hex_to_int(pending_count)
+    if pending_nonce > latest_nonce:
+        print(f'{pending_nonce - latest_nonce} transactions from this wallet are still pending. '
+              'Run approveContracts() again once they are mined.')
+        return
 
-    
-    nonce = web3.eth.getTransactionCount( wallet.address )
-    raw_txn_2 = usdc_contract.functions.approve("0xC5d563A36AE78145C45a50134d48A1215220f80a", int(MAX_INT, 0)).build_transaction({
-        "chainId": 137, 
-        "from": wallet.address, 
-        "nonce": nonce
-    })
-    signed_txn_2 = web3.eth.account.sign_transaction(raw_txn_2, private_key=os.getenv("PK"))
-    send_txn_2 = web3.eth.send_raw_transaction(signed_txn_2.rawTransaction)
+    # Nonces are allocated locally from the single pending count
+    nonce_counter = itertools.count(pending_nonce)
+
+    # EIP-1559 fees, computed once for the whole batch. 2x base fee leaves
+    # room for the base fee to rise over several blocks before inclusion.
+    base_fee = _hex_to_int(pending_block['baseFeePerGas'])
+    priority_fee = web3.to_wei(PRIORITY_FEE_GWEI, 'gwei')
+    max_fee = 2 * base_fee + priority_fee
+
+    signed_txns = []
+    for label, to, data in approvals:
+        raw_txn = {
+            "chainId": 137,
+            "nonce": next(nonce_counter),
+            "to": to,
+            "value": 0,
+            "data": data,
+            "gas": APPROVAL_GAS_LIMIT,
+            "type": 2,
+            "maxFeePerGas": max_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+        signed_txns.append((label, wallet.sign_transaction(raw_txn)))
+
+    # Submit every signed transaction in one JSON-RPC batch, then poll all receipts together
+    responses = _rpc_batch_responses(endpoint, [
+        ("eth_sendRawTransaction", [Web3.to_hex(signed.rawTransaction)]) for _, signed in signed_txns
+    ])
 
+    failed = [(label, item["error"]) for (label, _), item in zip(signed_txns, responses) if "error" in item]
+    if failed:
+        # Accepted transactions stay in the mempool, so report them before bailing out
+        for (label, _), item in zip(signed_txns, responses):
+            if "error" in item:
+                print(f'{label} rejected: {item["error"]}')
+            else:
+                print(f'{label} submitted. Hash: {item.get("result")}')
+        raise ValueError(f"{len(failed)} of {len(signed_txns)} approval transactions were rejected")
 
-    nonce = web3.eth.getTransactionCount( wallet.address )
-    raw_txn_3 = usdc_contract.functions.approve("0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296", int(MAX_INT, 0)).build_transaction({
-        "chainId": 137, 
-        "from": wallet.address, 
-        "nonce": nonce
-    })
-    signed_txn_3 = web3.eth.account.sign_transaction(raw_txn_3, private_key=os.getenv("PK"))
-    send_txn_3 = web3.eth.send_raw_transaction(signed_txn_3.rawTransaction)
+    tx_hashes = [item.get("result") for item in responses]
+    receipts = _wait_for_receipts(endpoint, tx_hashes, 600)
+
+    # Approvals are sent with a fixed gas limit and no gas estimate, so a
+    # revert only shows up in the receipt status
+    reverted = 0
+    for (label, _), receipt in zip(signed_txns, receipts):
+        if receipt.get("status") == "0x1":
+            print(f'{label} completed. Hash: {receipt.get("transactionHash", "N/A")}')
+        else:
+            reverted += 1
+            print(f'{label} failed on-chain (status {receipt.get("status")}). Hash: {receipt.get("transactionHash", "N/A")}')
+    if reverted:
+        raise ValueError(f"{reverted} of {len(signed_txns)} approval transactions reverted")
     
     
 def market_action( marketId, action, price, size ):
@@ -192,8 +456,20 @@ def market_action( marketId, action, price, size ):
         # Sell $50 worth at 45% probability
         market_action("0x123abc...", "SELL", 0.45, 50)
     
+    Transient failures while posting (network errors and HTTP 429) are
+    retried up to POST_ORDER_ATTEMPTS times with exponential backoff. If a
+    retry is rejected as a duplicate, the earlier attempt went through and
+    the order counts as posted. Any other error is reported and re-raised so
+    callers can decide what to do.
+    
     Returns:
-        None (prints order ID if successful)
+        dict: The CLOB response for the posted order (includes 'orderID').
+        When a retry found the order already posted, the response is
+        {"orderID": None, "status": "duplicate"}.
+        
+    Raises:
+        RuntimeError: If the CLOB client could not be created
+        PolyApiException: If the order is rejected or retries are exhausted
     """
     order_args = OrderArgs(
         price=price,
@@ -201,22 +477,86 @@ def market_action( marketId, action, price, size ):
         side=action,
         token_id=marketId,
     )
-    signed_order = get_clob_client().create_order(order_args)
-    
+    client = get_clob_client()
+    if client is None:
+        raise RuntimeError("Could not create CLOB client. Please check your PK environment variable and network connection.")
+
     try:
-        resp = get_clob_client().post_order(signed_order)
-        print(f"Order posted successfully: {resp.get('orderID', 'N/A') if isinstance(resp, dict) else 'Success'}")
-    except Exception as ex:
-        print("Error posting order. Please check your balance and order parameters.")
-        pass
+        signed_order = client.create_order(order_args)
+    except Exception:
+        print("Error signing order. Please check the market ID, price and size.")
+        raise
+
+    for attempt in range(1, POST_ORDER_ATTEMPTS + 1):
+        try:
+            resp = client.post_order(signed_order)
+            break
+        except PolyApiException as ex:
+            if attempt > 1 and _is_duplicate_order(ex):
+                # An earlier attempt reached the CLOB even though its response was lost
+                print("Order was already accepted by an earlier attempt.")
+                resp = {"orderID": None, "status": "duplicate"}
+                break
+            if ex.status_code == 401:
+                # Stale API creds; make the next call re-authenticate
+                invalidate_clob_client()
+            if not _is_retryable(ex) or attempt == POST_ORDER_ATTEMPTS:
+                print(f"Error posting order (attempt {attempt}/{POST_ORDER_ATTEMPTS}). Please check your balance and order parameters.")
+                raise
+            delay = min(POST_ORDER_MAX_DELAY, POST_ORDER_MIN_DELAY * 2 ** (attempt - 1))
+            print(f"Transient error posting order (attempt {attempt}/{POST_ORDER_ATTEMPTS}), retrying in {delay:.1f}s: {ex}")
+            time.sleep(delay)
+
+    invalidate_position_cache(marketId)
+    print(f"Order posted successfully: {resp.get('orderID', 'N/A') if isinstance(resp, dict) else 'Success'}")
+    return resp
+
+
+def _is_retryable(ex):
+    """
+    True for CLOB errors worth retrying: no HTTP response or rate limiting.
     
+    5xx responses are not retried. POST /order is not idempotent, and a
+    gateway error often means the order was accepted anyway.
+    """
+    return ex.status_code is None or ex.status_code == 429
+
+
+def _is_duplicate_order(ex):
+    """True if the CLOB rejected an order because it was already posted."""
+    return "duplicate" in str(ex.error_msg).lower()
+
+
+def _best_bid(bids):
+    """
+    Return the highest bid price in an order book side, or 0.0 if there are no bids.
     
+    The CLOB makes no ordering guarantee for bid levels, so the best bid is taken
+    as an explicit maximum.
+    """
+    return max((float(bid.price) for bid in bids), default=0.0)
+
+
+def _cache_put(cache, key, value):
+    """Store an entry in a position cache, evicting the oldest entry when full. Caller holds the lock."""
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > POSITION_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+
+
 def get_position(marketId):
     """
     Get the current USD value of your position in a specific market.
     
     Calculates position value by multiplying your share balance by the
-    current best bid price from the order book.
+    current best (highest) bid price from the order book. A market with no
+    bids is valued at 0.
+    
+    The share balance is cached for BALANCE_TTL seconds and the best bid for
+    ORDER_BOOK_TTL seconds, so frequent polling stays cheap. Both are dropped
+    early by invalidate_position_cache(), which market_action() calls after
+    posting an order.
     
     Args:
         marketId (str): Token ID for the market outcome
@@ -229,13 +569,85 @@ def get_position(marketId):
         print(f"Position worth: ${value:.2f}")
     """
     client = get_clob_client()
-    position_res = client.get_balance_allowance(
-        BalanceAllowanceParams(
-            asset_type=AssetType.CONDITIONAL,
-            token_id=marketId
+
+    with _POSITION_CACHE_LOCK:
+        generation = _POSITION_CACHE_GENERATION
+        cached_balance = _BALANCE_CACHE.get(marketId)
+        cached_bid = _BEST_BID_CACHE.get(marketId)
+
+    if cached_balance is not None and time.monotonic() - cached_balance[0] < BALANCE_TTL:
+        shares = cached_balance[1]
+    else:
+        fetched_at = time.monotonic()
+        position_res = client.get_balance_allowance(
+            BalanceAllowanceParams(
+                asset_type=AssetType.CONDITIONAL,
+                token_id=marketId
+            )
         )
-    )
-    orderBook = client.get_order_book(marketId)
-    price = float(orderBook.bids[-1].price)
-    shares = int(position_res['balance']) / 1e6
-    return shares * price
\ No newline at end of file
+        shares = int(position_res['balance']) / 1e6
+        with _POSITION_CACHE_LOCK:
+            if generation == _POSITION_CACHE_GENERATION:
+                _cache_put(_BALANCE_CACHE, marketId, (fetched_at, shares))
+
+    if cached_bid is not None and time.monotonic() - cached_bid[0] < ORDER_BOOK_TTL:
+        price = cached_bid[1]
+    else:
+        fetched_at = time.monotonic()
+        orderBook = client.get_order_book(marketId)
+        price = _best_bid(orderBook.bids)
+        with _POSITION_CACHE_LOCK:
+            if generation == _POSITION_CACHE_GENERATION:
+                _cache_put(_BEST_BID_CACHE, marketId, (fetched_at, price))
+
+    return shares * price
+
+
+def get_positions(marketIds, max_workers=5):
+    """
+    Get the current USD value of your positions in several markets at once.
+    
+    Runs get_position() for each market on a thread pool, so total runtime is
+    bounded by the slowest markets instead of growing with the number of markets.
+    
+    Args:
+        marketIds (list): Token IDs for the market outcomes
+        max_workers (int): Maximum number of concurrent API requests
+        
+    Returns:
+        dict: marketId -> position value in USD
+        
+    Raises:
+        Any error raised by get_position() for one of the markets, so a
+        partial portfolio is never returned silently
+        
+    Example:
+        values = get_positions(["0x123abc...", "0x456def..."])
+        print(f"Portfolio worth: ${sum(values.values()):.2f}")
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {marketId: executor.submit(get_position, marketId) for marketId in marketIds}
+        return {marketId: future.result() for marketId, future in futures.items()}
+
+
+def invalidate_position_cache(marketId=None):
+    """
+    Forget cached balance and order book data used by get_position().
+    
+    market_action() calls this after a successful order. Cached entries also
+    expire on their own (see BALANCE_TTL and ORDER_BOOK_TTL), so this is only
+    needed for an immediately fresh reading, e.g. right after a fill or a
+    trade placed on the Polymarket website.
+    
+    Args:
+        marketId (str, optional): Token ID to invalidate. Clears every market if omitted.
+    """
+    global _POSITION_CACHE_GENERATION
+    with _POSITION_CACHE_LOCK:
+        _POSITION_CACHE_GENERATION += 1
+        if marketId is None:
+            _BALANCE_CACHE.clear()
+            _BEST_BID_CACHE.clear()
+        else:
+            _BALANCE_CACHE.pop(marketId, None)
+            _BEST_BID_CACHE.pop(marketId, None)
\ No newline at end of file